@@ -210,6 +210,66 @@ class Caltech256TestCase(datasets_utils.ImageDatasetTestCase):
 
         return num_images_per_category * len(categories)
 
+    def test_output_tensor(self):
+        with self.create_dataset(output="tensor") as (dataset, _):
+            img, target = dataset[0]
+            assert isinstance(img, torch.Tensor)
+            assert img.dtype == torch.uint8
+            assert img.shape[0] == 3
+            assert isinstance(target, int)
+
+    def test_return_bytes(self):
+        with self.create_dataset(return_bytes=True) as (dataset, _):
+            data, target = dataset[0]
+            assert isinstance(data, torch.Tensor)
+            assert data.dtype == torch.uint8
+            assert data.ndim == 1
+            # The buffer should hold the raw JPEG stream, not decoded pixels.
+            assert bytes(data[:2].tolist()) == b"\xff\xd8"
+            assert isinstance(target, int)
+
+    def test_cache_decoded(self):
+        with self.create_dataset(cache_decoded=4) as (dataset, _):
+            cold, _ = dataset[0]
+            warm, _ = dataset[0]
+            # A cache hit must not change the output contract.
+            assert isinstance(cold, PIL.Image.Image)
+            assert isinstance(warm, PIL.Image.Image)
+            assert cold.size == warm.size
+
+            # The LRU is dropped on pickling and rebuilt on the other side, so
+            # spawn-based DataLoader workers can carry the dataset across.
+            reloaded = pickle.loads(pickle.dumps(dataset))
+            img, _ = reloaded[0]
+            assert isinstance(img, PIL.Image.Image)
+
+    def test_index_cache_roundtrip(self):
+        with self.create_dataset() as (dataset, _):
+            assert os.path.isfile(os.path.join(dataset.root, ".caltech_index.pkl"))
+
+            reloaded = datasets.Caltech256(os.path.dirname(dataset.root))
+            assert reloaded.image_paths == dataset.image_paths
+            assert reloaded.y.tolist() == dataset.y.tolist()
+            assert reloaded.categories == dataset.categories
+
+    def test_shard_requires_preprocess(self):
+        with pytest.raises(RuntimeError, match="preprocessed pixel shard"):
+            with self.create_dataset(output="shard"):
+                pass
+
+    def test_preprocess_shard(self):
+        size = 8
+        with self.create_dataset() as (dataset, _):
+            dataset.preprocess(size=size)
+
+            shard = datasets.Caltech256(os.path.dirname(dataset.root), output="shard")
+            assert len(shard) == len(dataset)
+            img, target = shard[0]
+            assert isinstance(img, torch.Tensor)
+            assert img.dtype == torch.uint8
+            assert img.shape == (3, size, size)
+            assert isinstance(target, int)
+
 
 class WIDERFaceTestCase(datasets_utils.ImageDatasetTestCase):
     DATASET_CLASS = datasets.WIDERFace
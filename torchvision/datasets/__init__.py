@@ -11,7 +11,7 @@ from ._stereo_matching import (
     SceneFlowStereo,
     SintelStereo,
 )
-from .caltech import Caltech101, Caltech256
+from .caltech import Caltech101, Caltech256, caltech_gpu_collate
 from .celeba import CelebA
 from .cifar import CIFAR10, CIFAR100
 from .cityscapes import Cityscapes
@@ -90,6 +90,7 @@ __all__ = (
     "ImageNet",
     "Caltech101",
     "Caltech256",
+    "caltech_gpu_collate",
     "CelebA",
     "WIDERFace",
     "SBDataset",
@@ -1,16 +1,464 @@
+import functools
+import mmap
 import os
 import os.path
+import pickle
 import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
 
+import numpy as np
+import torch
 from PIL import Image
 
+from ..io.image import ImageReadMode, read_image
 from .utils import download_and_extract_archive, extract_archive, verify_str_arg
 from .vision import VisionDataset
 
-
-class Caltech101(VisionDataset):
+try:
+    # scipy is only needed for target_type="annotation"; binding loadmat once at
+    # import time keeps the per-sample path free of sys.modules lookups.
+    from scipy.io import loadmat as _loadmat
+except ImportError:
+    _loadmat = None
+
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def _hint_willneed(path: str) -> None:
+    # Ask the kernel to start populating the page cache for a file this worker
+    # is about to read, so the next decode does not block on the disk.
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _count_jpgs(path: str) -> int:
+    # scandir avoids materializing a list of filename strings just to count.
+    with os.scandir(path) as it:
+        return sum(1 for entry in it if entry.name.endswith(".jpg"))
+
+
+def _count_category_jpgs(base: str, categories: list[str]) -> list[int]:
+    # scandir releases the GIL during the syscall, so scanning the categories
+    # from a thread pool overlaps the per-directory latency on networked
+    # filesystems. map() keeps the results in category order.
+    with ThreadPoolExecutor(max_workers=min(32, max(len(categories), 1))) as executor:
+        return list(executor.map(_count_jpgs, (os.path.join(base, c) for c in categories)))
+
+
+# For some reason, the category names in "101_ObjectCategories" and
+# "Annotations" do not always match. This is a manual map between the
+# two. Defaults to using same name, since most names are fine.
+_ANNOTATION_NAME_MAP = {
+    "Faces": "Faces_2",
+    "Faces_easy": "Faces_3",
+    "Motorbikes": "Motorbikes_16",
+    "airplanes": "Airplanes_Side_2",
+}
+
+_ANNOTATION_SIDECAR = "annotations.npz"
+
+
+def _build_annotation_sidecar(root: str) -> None:
+    # Decode every .mat annotation once and store the contours in a single
+    # .npz file, so fetching an annotation later is a plain array lookup
+    # instead of parsing a MATLAB v5 container.
+    if _loadmat is None:
+        return
+    categories = sorted(os.listdir(os.path.join(root, "101_ObjectCategories")))
+    if "BACKGROUND_Google" in categories:
+        categories.remove("BACKGROUND_Google")
+    contours = {}
+    for i, c in enumerate(categories):
+        ann_dir = os.path.join(root, "Annotations", _ANNOTATION_NAME_MAP.get(c, c))
+        try:
+            names = sorted(entry.name for entry in os.scandir(ann_dir) if entry.name.endswith(".mat"))
+        except OSError:
+            continue
+        for name in names:
+            # "annotation_0042.mat" -> key "<category index>_0042"
+            key = f"{i}_{name[len('annotation_') : -len('.mat')]}"
+            contours[key] = _loadmat(os.path.join(ann_dir, name), variable_names=("obj_contour",))["obj_contour"]
+    np.savez(os.path.join(root, _ANNOTATION_SIDECAR), **contours)
+
+
+_PIXELS_FILE = "pixels.bin"
+_PIXELS_META_FILE = ".pixels_meta.pkl"
+
+
+def _write_pixel_shard(root: str, image_dir: str, image_paths: list[str], size: int) -> None:
+    # Decode the whole corpus once into a flat (N, 3, size, size) uint8 file,
+    # FFCV-style, so serving a sample later is a pure memmap slice.
+    num = len(image_paths)
+    pixels = np.memmap(os.path.join(root, _PIXELS_FILE), dtype=np.uint8, mode="w+", shape=(num, 3, size, size))
+    for i, path in enumerate(image_paths):
+        with Image.open(path) as img:
+            arr = np.asarray(img.convert("RGB").resize((size, size)))
+        pixels[i] = arr.transpose(2, 0, 1)
+    pixels.flush()
+    with open(os.path.join(root, _PIXELS_META_FILE), "wb") as f:
+        pickle.dump((num, size, os.stat(image_dir).st_mtime_ns), f, protocol=5)
+
+
+def _load_pixel_shard(root: str, image_dir: str, num_samples: int) -> Optional[np.memmap]:
+    meta_path = os.path.join(root, _PIXELS_META_FILE)
+    try:
+        with open(meta_path, "rb") as f:
+            num, size, mtime = pickle.load(f)
+        if num != num_samples or mtime != os.stat(image_dir).st_mtime_ns:
+            # Stale shard from a different or re-extracted copy of the dataset.
+            return None
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    try:
+        return np.memmap(os.path.join(root, _PIXELS_FILE), dtype=np.uint8, mode="r", shape=(num, 3, size, size))
+    except (OSError, ValueError):
+        return None
+
+
+def _extract_with_libarchive(archive: str, dst: str) -> bool:
+    # Stream entries through the C libarchive bindings, which decompress
+    # without holding the GIL, instead of Python's tarfile module. Returns
+    # False when the bindings are unavailable so the caller can fall back.
+    try:
+        import libarchive  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+    with libarchive.file_reader(archive) as entries:
+        for entry in entries:
+            pathname = str(entry.pathname)
+            if pathname.startswith("__MACOSX"):
+                continue
+            target = os.path.join(dst, *pathname.split("/"))
+            if entry.isdir:
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as f:
+                for block in entry.get_blocks():
+                    f.write(block)
+    return True
+
+
+def _extract_with_pigz(archive: str, dst: str) -> bool:
+    # gunzip is single-threaded and CPU-bound; pigz decompresses the stream on
+    # all cores and tar unpacks it as it arrives. Returns False when either
+    # tool is missing so the caller can fall back.
+    if not archive.endswith(".gz") or shutil.which("pigz") is None or shutil.which("tar") is None:
+        return False
+    try:
+        # The context manager closes the parent's pipe end and waits on pigz
+        # even when tar fails, so a dead pipeline cannot leave pigz blocked
+        # on a full pipe.
+        with subprocess.Popen(["pigz", "-dc", archive], stdout=subprocess.PIPE) as pigz:
+            try:
+                subprocess.run(["tar", "-xf", "-", "-C", dst], stdin=pigz.stdout, check=True)
+            except (OSError, subprocess.CalledProcessError):
+                pigz.kill()
+                return False
+        return pigz.returncode == 0
+    except OSError:
+        return False
+
+
+_INDEX_CACHE_FILE = ".caltech_index.pkl"
+
+
+def _load_index_cache(root: str, image_dir: str) -> Optional[tuple[list[str], list[int], list[int]]]:
+    # The cache is keyed by the mtime of the image directory, so it is
+    # invalidated whenever categories are added or removed.
+    try:
+        with open(os.path.join(root, _INDEX_CACHE_FILE), "rb") as f:
+            mtime, categories, index, y = pickle.load(f)
+        if mtime != os.stat(os.path.join(root, image_dir)).st_mtime_ns:
+            return None
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    return categories, index, y
+
+
+def _save_index_cache(root: str, image_dir: str, categories: list[str], index: list[int], y: list[int]) -> None:
+    try:
+        mtime = os.stat(os.path.join(root, image_dir)).st_mtime_ns
+        with open(os.path.join(root, _INDEX_CACHE_FILE), "wb") as f:
+            pickle.dump((mtime, categories, index, y), f, protocol=5)
+    except OSError:
+        # The cache is a best-effort speed-up; a read-only root is fine.
+        pass
+
+
+_TURBOJPEG = None
+_TURBOJPEG_PID = None
+
+
+def _get_turbojpeg():
+    # Cache one decoder handle per worker process. The handle wraps C state
+    # that is not fork-safe, so it is re-created whenever the pid changes.
+    global _TURBOJPEG, _TURBOJPEG_PID
+    pid = os.getpid()
+    if _TURBOJPEG is None or _TURBOJPEG_PID != pid:
+        from turbojpeg import TurboJPEG
+
+        _TURBOJPEG = TurboJPEG()
+        _TURBOJPEG_PID = pid
+    return _TURBOJPEG
+
+
+def _open_mmap(path: str) -> mmap.mmap:
+    # A read-only mapping hands the decoder a zero-copy view of the page cache
+    # instead of reading the file into a fresh bytes object first.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        # mmap holds its own duplicate of the descriptor.
+        os.close(fd)
+
+
+# The DCT scaling ratios libjpeg-turbo can apply during decode.
+_TURBOJPEG_SCALING_FACTORS = ((1, 8), (1, 4), (3, 8), (1, 2), (5, 8), (3, 4), (7, 8), (1, 1))
+
+
+def _pick_scaling_factor(width: int, height: int, target: int) -> tuple[int, int]:
+    # Smallest factor whose output still covers `target` pixels on the short
+    # side; the IDCT then emits the downscaled image directly instead of
+    # decoding at full resolution and resizing afterwards.
+    for num, denom in _TURBOJPEG_SCALING_FACTORS:
+        if min(width, height) * num >= target * denom:
+            return num, denom
+    return 1, 1
+
+
+def _decode_image(path: str, backend: str, wrap_pil: bool, decode_size: Optional[int] = None) -> Any:
+    if backend == "turbojpeg":
+        from turbojpeg import TJPF_RGB
+
+        try:
+            with _open_mmap(path) as mm:
+                turbojpeg = _get_turbojpeg()
+                if decode_size is not None:
+                    width, height, _, _ = turbojpeg.decode_header(mm)
+                    scaling_factor = _pick_scaling_factor(width, height, decode_size)
+                    arr = turbojpeg.decode(mm, pixel_format=TJPF_RGB, scaling_factor=scaling_factor)
+                else:
+                    arr = turbojpeg.decode(mm, pixel_format=TJPF_RGB)
+        except OSError:
+            # libjpeg-turbo rejects a small number of slightly malformed files
+            # that PIL decodes fine, so fall back for those.
+            return Image.open(path)
+        # Skip the PIL round-trip (and its extra copy) unless the caller needs it.
+        return Image.fromarray(arr) if wrap_pil else arr
+    try:
+        mm = _open_mmap(path)
+    except (OSError, ValueError):
+        # Empty or otherwise unmappable file; let PIL read it the regular way.
+        return Image.open(path)
+    with mm:
+        # mmap objects are file-like, so PIL can decode straight from the
+        # mapping as long as the pixels are materialized before it is closed.
+        img = Image.open(mm)
+        img.load()
+    return img
+
+
+def _decode_into_slot(path: str, backend: str, slot: memoryview, decode_size: Optional[int] = None) -> np.ndarray:
+    # Write the decoded pixels into the caller-owned (typically shared-memory)
+    # buffer, so the sample reaches the main process without being pickled
+    # across the worker boundary and re-copied at collate. Neither decoder
+    # exposes a destination-buffer API, so the pixels are staged once and
+    # copied; the slot layout is CHW uint8 to match the (B, 3, H, W) batch
+    # tensor the buffer owner holds.
+    arr = _decode_image(path, backend, wrap_pil=False, decode_size=decode_size)
+    if isinstance(arr, Image.Image):
+        arr = np.asarray(arr.convert("RGB"))
+    chw = np.ascontiguousarray(arr.transpose(2, 0, 1))
+    out = np.frombuffer(slot, dtype=np.uint8)
+    if chw.size > out.size:
+        raise ValueError(f"decoded image of shape {chw.shape} does not fit into the {out.size}-byte slot")
+    out[: chw.size] = chw.reshape(-1)
+    # Return the slot-backed view so the per-sample (3, H, W) shape travels
+    # with the sample and the buffer owner can slice variable-sized images.
+    return out[: chw.size].reshape(chw.shape)
+
+
+def _read_jpeg_bytes(path: str) -> torch.Tensor:
+    with open(path, "rb") as f:
+        # bytearray gives torch.frombuffer a writable buffer; wrapping the
+        # read-only bytes object would warn about a non-writable tensor.
+        return torch.frombuffer(bytearray(f.read()), dtype=torch.uint8)
+
+
+def caltech_gpu_collate(batch: list[tuple[torch.Tensor, Any]]) -> tuple[list[torch.Tensor], torch.Tensor]:
+    """Collate function for :class:`Caltech101`/:class:`Caltech256` with ``return_bytes=True``.
+
+    Decodes the raw JPEG bytes of a whole batch on the GPU with nvJPEG through
+    :func:`torchvision.io.decode_jpeg`, which is considerably faster than decoding
+    one image at a time on the CPU workers. Caltech images vary in size, so the
+    decoded tensors are returned as a list; resize or crop them on the GPU before
+    stacking into a batch tensor.
+
+    Returns:
+        tuple: ``(images, targets)`` where ``images`` is a list of ``(3, H, W)`` uint8
+        CUDA tensors and ``targets`` is a ``(N,)`` int64 tensor.
+    """
+    from torchvision.io import decode_jpeg, ImageReadMode
+
+    images = decode_jpeg([data for data, _ in batch], mode=ImageReadMode.RGB, device=torch.device("cuda"))
+    targets = torch.tensor([target for _, target in batch], dtype=torch.int64)
+    return images, targets
+
+
+class _CaltechImageAccess:
+    # Sample-fetch machinery shared by Caltech101 and Caltech256. Both classes
+    # set backend, output, return_bytes, decode_size, prefetch_next, the
+    # decoded-image cache, image_paths and _pixels in __init__; the methods
+    # here only read them, so the two decode dispatch paths cannot drift.
+
+    # Assigned by the subclasses' __init__; declared here so mypy can check
+    # the shared methods against them.
+    root: str
+    transform: Optional[Callable]
+    backend: str
+    output: str
+    return_bytes: bool
+    cache_decoded: int
+    decode_size: Optional[int]
+    prefetch_next: bool
+    preallocated_slot: Optional[Callable[[int], memoryview]]
+    image_paths: list[str]
+    _img_base: str
+    _pixels: Optional[np.memmap]
+    _reader: Callable[..., torch.Tensor]
+    _decode_cached: Optional[functools._lru_cache_wrapper]
+
+    def _init_decode_options(
+        self,
+        backend: str,
+        return_bytes: bool,
+        output: str,
+        cache_decoded: int,
+        decode_size: Optional[int],
+        prefetch_next: bool,
+    ) -> None:
+        # Validate and store the decode options for both datasets in one
+        # place, so the constructors cannot drift apart either.
+        self.return_bytes = return_bytes
+        self.decode_size = decode_size
+        self.prefetch_next = prefetch_next
+        self.backend = verify_str_arg(backend, "backend", ("pil", "turbojpeg"))
+        if self.backend == "turbojpeg":
+            try:
+                _get_turbojpeg()
+            except ImportError:
+                raise RuntimeError("backend='turbojpeg' requires the PyTurboJPEG package")
+        self.output = verify_str_arg(output, "output", ("pil", "tensor", "shard"))
+        if return_bytes and self.output == "shard":
+            raise ValueError("return_bytes=True is incompatible with output='shard'")
+        self._reader = read_image
+        # Optional zero-copy handoff: a DataLoader wrapper that owns a shared
+        # memory batch buffer can set this to a callable mapping a sample index
+        # to that sample's slot, and workers will decode directly into it.
+        self.preallocated_slot = None
+        self.cache_decoded = cache_decoded
+        self._decode_cached = self._make_decode_cache()
+
+    def preprocess(self, size: int = 224) -> None:
+        """Decode and resize every image once into a memory-mapped uint8 file.
+
+        Datasets constructed with ``output="shard"`` from the same root then serve
+        ``(3, size, size)`` uint8 tensors sliced out of the file, with no JPEG decode
+        and no per-file syscall in the hot path.
+        """
+        _write_pixel_shard(self.root, self._img_base, self.image_paths, size)
+        if self.output == "shard":
+            self._pixels = _load_pixel_shard(self.root, self._img_base, len(self.image_paths))
+
+    def _load_shard_or_raise(self) -> np.memmap:
+        pixels = _load_pixel_shard(self.root, self._img_base, len(self.image_paths))
+        if pixels is None:
+            raise RuntimeError(
+                "output='shard' requires a preprocessed pixel shard matching the current data; "
+                "construct the dataset with the default output and call preprocess() first"
+            )
+        return pixels
+
+    def _get_image(self, index: int) -> Any:
+        if self.output == "shard":
+            # Copy the slice out of the read-only mapping so torch gets a
+            # writable buffer.
+            return torch.from_numpy(np.array(self._pixels[index]))
+        path = self.image_paths[index]
+        if self.return_bytes:
+            return _read_jpeg_bytes(path)
+        if self.preallocated_slot is not None:
+            return _decode_into_slot(path, self.backend, self.preallocated_slot(index), decode_size=self.decode_size)
+        if self._decode_cached is not None:
+            # The cached pixels are shared between hits, so treat them as
+            # read-only downstream.
+            arr = self._decode_cached(index)
+            if self.output == "tensor":
+                # Copy while transposing to CHW: handing out a view of the
+                # cache entry would alias every later hit for this index, and
+                # PIL-backed arrays are read-only.
+                return torch.from_numpy(np.ascontiguousarray(arr.transpose(2, 0, 1)))
+            # Match the uncached contract: the PIL backend always returns a
+            # PIL image, turbojpeg an ndarray unless a transform needs PIL.
+            if self.backend == "pil" or self.transform is not None:
+                return Image.fromarray(arr)
+            return arr
+        if self.output == "tensor":
+            return self._reader(path, ImageReadMode.RGB)
+        return _decode_image(path, self.backend, wrap_pil=self.transform is not None, decode_size=self.decode_size)
+
+    def _decode_raw(self, index: int) -> np.ndarray:
+        # Cache entries are uniform RGB arrays, so grayscale and palette JPEGs
+        # are served in RGB mode whenever the cache is enabled; see the
+        # cache_decoded documentation.
+        img = _decode_image(self.image_paths[index], self.backend, wrap_pil=False, decode_size=self.decode_size)
+        if isinstance(img, Image.Image):
+            img = np.asarray(img.convert("RGB"))
+        return img
+
+    def clear_decoded_cache(self) -> None:
+        """Drop the decoded-image LRU, e.g. from ``worker_init_fn`` after forking."""
+        if self._decode_cached is not None:
+            self._decode_cached.cache_clear()
+
+    def _make_decode_cache(self):
+        if self.cache_decoded > 0:
+            return functools.lru_cache(maxsize=self.cache_decoded)(self._decode_raw)
+        return None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # lru_cache wrappers cannot be pickled, which would break spawn- and
+        # forkserver-based DataLoader workers; drop the cache here and rebuild
+        # it on the other side. Each worker starting with a cold cache is
+        # exactly what the per-worker semantics want.
+        state = self.__dict__.copy()
+        state["_decode_cached"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._decode_cached = self._make_decode_cache()
+
+    def _hint_next(self, index: int) -> None:
+        # Overlap the next sample's read with whatever happens between fetches.
+        # Opt-in, since the hint only pays off for in-order samplers and modes
+        # that actually read the image files.
+        if self.prefetch_next and _HAS_FADVISE and self._pixels is None and index + 1 < len(self.image_paths):
+            _hint_willneed(self.image_paths[index + 1])
+
+
+class Caltech101(_CaltechImageAccess, VisionDataset):
     """`Caltech 101 <https://data.caltech.edu/records/20086>`_ Dataset.
 
     .. warning::
@@ -36,6 +484,40 @@ class Caltech101(VisionDataset):
             .. warning::
 
                 To download the dataset `gdown <https://github.com/wkentaro/gdown>`_ is required.
+        backend (string, optional): The image decoding backend, ``"pil"`` or ``"turbojpeg"``.
+            ``"turbojpeg"`` decodes with `libjpeg-turbo <https://libjpeg-turbo.org/>`_ through
+            `PyTurboJPEG <https://github.com/lilohuang/PyTurboJPEG>`_, which is significantly
+            faster than PIL for JPEG files. With this backend the image is returned as a
+            ``numpy.ndarray`` unless a ``transform`` is set, in which case it is wrapped in a
+            PIL image first. Defaults to ``"pil"``.
+        return_bytes (bool, optional): If true, ``__getitem__`` skips decoding entirely and
+            returns the raw JPEG bytes as a uint8 tensor, for use with
+            :func:`caltech_gpu_collate` which batch-decodes on the GPU with nvJPEG.
+            ``transform`` is not applied in this mode. Defaults to ``False``.
+        output (string, optional): The image type returned by ``__getitem__``, ``"pil"``,
+            ``"tensor"`` or ``"shard"``. With ``"tensor"``, images are decoded with
+            :func:`torchvision.io.read_image` into a ``(3, H, W)`` uint8 tensor, skipping
+            the PIL round-trip that ``ToTensor`` would otherwise undo; ``transform`` then
+            receives the tensor directly. With ``"shard"``, fixed-size uint8 tensors are
+            served from the memory-mapped file written by :meth:`preprocess`, which must
+            have been run for this root beforehand. Defaults to ``"pil"``.
+        cache_decoded (int, optional): If positive, keep an LRU cache of this many decoded
+            images per worker, so samples that are revisited across epochs (e.g. with a
+            subset or oversampling sampler) are not decoded again. Cached images are
+            stored as RGB pixel arrays, so grayscale and palette JPEGs are returned in
+            RGB mode rather than their native one. Call :meth:`clear_decoded_cache` from
+            ``worker_init_fn`` to avoid sharing the cache across forked workers. Defaults
+            to ``0`` (no caching).
+        decode_size (int, optional): Only used with ``backend="turbojpeg"``. Target size of
+            the short image side; decoding applies the smallest libjpeg-turbo DCT scaling
+            factor (1/8 up to 1/1) that still covers it, so images headed for e.g. a
+            ``Resize(224)`` transform are never decoded at full resolution. Defaults to
+            ``None`` (decode at full resolution).
+        prefetch_next (bool, optional): If true, each fetch issues a
+            ``posix_fadvise(WILLNEED)`` hint for the file at ``index + 1`` so the kernel
+            reads it into the page cache ahead of time. Only useful with samplers that
+            visit the dataset in order; under a shuffled sampler the hinted file is not
+            the one read next. Defaults to ``False``.
     """
 
     def __init__(
@@ -45,12 +527,21 @@ class Caltech101(VisionDataset):
         transform: Optional[Callable] = None,
         target_transform: Optional[Callable] = None,
         download: bool = False,
+        backend: str = "pil",
+        return_bytes: bool = False,
+        output: str = "pil",
+        cache_decoded: int = 0,
+        decode_size: Optional[int] = None,
+        prefetch_next: bool = False,
     ) -> None:
         super().__init__(os.path.join(root, "caltech101"), transform=transform, target_transform=target_transform)
         os.makedirs(self.root, exist_ok=True)
         if isinstance(target_type, str):
             target_type = [target_type]
         self.target_type = [verify_str_arg(t, "target_type", ("category", "annotation")) for t in target_type]
+        if "annotation" in self.target_type and _loadmat is None:
+            raise RuntimeError("target_type='annotation' requires scipy, which could not be imported")
+        self._init_decode_options(backend, return_bytes, output, cache_decoded, decode_size, prefetch_next)
 
         if download:
             self.download()
@@ -58,26 +549,47 @@ class Caltech101(VisionDataset):
         if not self._check_integrity():
             raise RuntimeError("Dataset not found or corrupted. You can use download=True to download it")
 
-        self.categories = sorted(os.listdir(os.path.join(self.root, "101_ObjectCategories")))
-        self.categories.remove("BACKGROUND_Google")  # this is not a real class
-
-        # For some reason, the category names in "101_ObjectCategories" and
-        # "Annotations" do not always match. This is a manual map between the
-        # two. Defaults to using same name, since most names are fine.
-        name_map = {
-            "Faces": "Faces_2",
-            "Faces_easy": "Faces_3",
-            "Motorbikes": "Motorbikes_16",
-            "airplanes": "Airplanes_Side_2",
-        }
-        self.annotation_categories = list(map(lambda x: name_map[x] if x in name_map else x, self.categories))
-
-        self.index: list[int] = []
-        self.y = []
-        for i, c in enumerate(self.categories):
-            n = len(os.listdir(os.path.join(self.root, "101_ObjectCategories", c)))
-            self.index.extend(range(1, n + 1))
-            self.y.extend(n * [i])
+        cached = _load_index_cache(self.root, "101_ObjectCategories")
+        if cached is not None:
+            self.categories, index, y = cached
+        else:
+            self.categories = sorted(os.listdir(os.path.join(self.root, "101_ObjectCategories")))
+            self.categories.remove("BACKGROUND_Google")  # this is not a real class
+
+            counts = _count_category_jpgs(os.path.join(self.root, "101_ObjectCategories"), self.categories)
+            index: list[int] = []
+            y: list[int] = []
+            for i, n in enumerate(counts):
+                index.extend(range(1, n + 1))
+                y.extend(n * [i])
+            _save_index_cache(self.root, "101_ObjectCategories", self.categories, index, y)
+
+        # int32 arrays take 4 bytes per sample instead of a boxed Python int each.
+        self.index = np.asarray(index, dtype=np.int32)
+        self.y = np.asarray(y, dtype=np.int32)
+
+        # Resolve every image path once so that __getitem__ does not have to
+        # re-join and re-format path components on each access.
+        self._img_base = os.path.join(self.root, "101_ObjectCategories")
+        self._ann_base = os.path.join(self.root, "Annotations")
+        self.image_paths = [
+            os.path.join(self._img_base, self.categories[i], f"image_{k:04d}.jpg") for i, k in zip(self.y, self.index)
+        ]
+        # The shard is only consulted when explicitly requested, so explicit
+        # decode modes are never overridden by a file someone left in root.
+        self._pixels = self._load_shard_or_raise() if self.output == "shard" else None
+
+        self.annotation_categories = tuple(_ANNOTATION_NAME_MAP.get(c, c) for c in self.categories)
+        # Per-category annotation directories, resolved once so the annotation
+        # fetch skips the name-map lookup and the join.
+        self._ann_dir = tuple(os.path.join(self._ann_base, c) for c in self.annotation_categories)
+
+        # Prefer the sidecar written by download() over per-sample .mat parsing.
+        self._ann = self._open_annotation_sidecar()
+
+        # Specialize the fetch path once instead of re-dispatching on
+        # target_type for every sample.
+        self._get = self._get_category if self.target_type == ["category"] else self._get_multi
 
     def __getitem__(self, index: int) -> tuple[Any, Any]:
         """
@@ -87,41 +599,72 @@ class Caltech101(VisionDataset):
         Returns:
             tuple: (image, target) where the type of target specified by target_type.
         """
-        import scipy.io
-
-        img = Image.open(
-            os.path.join(
-                self.root,
-                "101_ObjectCategories",
-                self.categories[self.y[index]],
-                f"image_{self.index[index]:04d}.jpg",
-            )
-        )
+        return self._get(index)
+
+    def _get_category(self, index: int) -> tuple[Any, Any]:
+        # Fast path for the common target_type=["category"] case: no per-target
+        # loop and no intermediate list/tuple construction.
+        img = self._get_image(index)
+        target: Any = int(self.y[index])
+
+        if self.transform is not None and not self.return_bytes:
+            img = self.transform(img)
+
+        if self.target_transform is not None:
+            target = self.target_transform(target)
+
+        self._hint_next(index)
+
+        return img, target
+
+    def _get_multi(self, index: int) -> tuple[Any, Any]:
+        img = self._get_image(index)
 
         target: Any = []
         for t in self.target_type:
             if t == "category":
-                target.append(self.y[index])
+                # Hand a plain Python int to collate rather than a numpy scalar.
+                target.append(int(self.y[index]))
             elif t == "annotation":
-                data = scipy.io.loadmat(
-                    os.path.join(
-                        self.root,
-                        "Annotations",
-                        self.annotation_categories[self.y[index]],
-                        f"annotation_{self.index[index]:04d}.mat",
-                    )
-                )
-                target.append(data["obj_contour"])
+                if self._ann is not None:
+                    target.append(self._ann[f"{self.y[index]}_{self.index[index]:04d}"])
+                else:
+                    # A single f-string against the precomputed directory is
+                    # cheaper than re-running os.path.join's logic per sample.
+                    path = f"{self._ann_dir[self.y[index]]}{os.sep}annotation_{self.index[index]:04d}.mat"
+                    # variable_names skips parsing the other MATLAB variables.
+                    data = _loadmat(path, variable_names=("obj_contour",))
+                    target.append(data["obj_contour"])
         target = tuple(target) if len(target) > 1 else target[0]
 
-        if self.transform is not None:
+        if self.transform is not None and not self.return_bytes:
             img = self.transform(img)
 
         if self.target_transform is not None:
             target = self.target_transform(target)
 
+        self._hint_next(index)
+
         return img, target
 
+    def _open_annotation_sidecar(self) -> Optional[Any]:
+        sidecar = os.path.join(self.root, _ANNOTATION_SIDECAR)
+        if "annotation" in self.target_type and os.path.isfile(sidecar):
+            return np.load(sidecar)
+        return None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # NpzFile keeps an open zip handle and cannot be pickled, which would
+        # break spawn- and forkserver-based DataLoader workers just like the
+        # decode cache; drop it here and reopen the sidecar on the other side.
+        state = super().__getstate__()
+        state["_ann"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._ann = self._open_annotation_sidecar()
+
     def _check_integrity(self) -> bool:
         # can be more robust and check hash of files
         return os.path.exists(os.path.join(self.root, "101_ObjectCategories"))
@@ -148,11 +691,14 @@ class Caltech101(VisionDataset):
         if os.path.isdir(macos_meta):
             shutil.rmtree(macos_meta)
 
-        # Extract '101_ObjectCategories.tar.gz' into self.root
-        extract_archive(category_archive, self.root, remove_finished=True)
-
-        # Extract 'Annotations.tar' into self.root
-        extract_archive(annotation_archive, self.root, remove_finished=True)
+        # Extract '101_ObjectCategories.tar.gz' and 'Annotations.tar' into
+        # self.root, preferring libarchive, then a pigz pipeline for the
+        # gzipped archive, before the single-threaded tarfile fallback.
+        for archive in (category_archive, annotation_archive):
+            if _extract_with_libarchive(archive, self.root) or _extract_with_pigz(archive, self.root):
+                os.remove(archive)
+            else:
+                extract_archive(archive, self.root, remove_finished=True)
 
         # Delete the 'caltech-101' folder (which may now be empty or contain only other hidden files)
         if os.path.isdir(archive_folder):
@@ -163,11 +709,15 @@ class Caltech101(VisionDataset):
         if os.path.isfile(zip_path):
             os.remove(zip_path)
 
+        # Convert the annotations into a single .npz sidecar while everything
+        # is already cold; __getitem__ then never parses a .mat file.
+        _build_annotation_sidecar(self.root)
+
     def extra_repr(self) -> str:
         return "Target type: {target_type}".format(**self.__dict__)
 
 
-class Caltech256(VisionDataset):
+class Caltech256(_CaltechImageAccess, VisionDataset):
     """`Caltech 256 <https://data.caltech.edu/records/20087>`_ Dataset.
 
     Args:
@@ -180,6 +730,22 @@ class Caltech256(VisionDataset):
         download (bool, optional): If true, downloads the dataset from the internet and
             puts it in root directory. If dataset is already downloaded, it is not
             downloaded again.
+        backend (string, optional): The image decoding backend, ``"pil"`` or ``"turbojpeg"``.
+            See :class:`Caltech101` for details. Defaults to ``"pil"``.
+        return_bytes (bool, optional): If true, ``__getitem__`` returns the raw JPEG bytes
+            as a uint8 tensor instead of a decoded image. See :class:`Caltech101` for
+            details. Defaults to ``False``.
+        output (string, optional): The image type returned by ``__getitem__``, ``"pil"``,
+            ``"tensor"`` or ``"shard"``. See :class:`Caltech101` for details. Defaults to
+            ``"pil"``.
+        cache_decoded (int, optional): If positive, keep an LRU cache of this many decoded
+            images per worker. See :class:`Caltech101` for details. Defaults to ``0``.
+        decode_size (int, optional): Only used with ``backend="turbojpeg"``. Target size of
+            the short image side for DCT-scaled decoding. See :class:`Caltech101` for
+            details. Defaults to ``None``.
+        prefetch_next (bool, optional): If true, hint the kernel to pre-read the file at
+            ``index + 1`` after each fetch. See :class:`Caltech101` for details. Defaults
+            to ``False``.
     """
 
     def __init__(
@@ -188,9 +754,16 @@ class Caltech256(VisionDataset):
         transform: Optional[Callable] = None,
         target_transform: Optional[Callable] = None,
         download: bool = False,
+        backend: str = "pil",
+        return_bytes: bool = False,
+        output: str = "pil",
+        cache_decoded: int = 0,
+        decode_size: Optional[int] = None,
+        prefetch_next: bool = False,
     ) -> None:
         super().__init__(os.path.join(root, "caltech256"), transform=transform, target_transform=target_transform)
         os.makedirs(self.root, exist_ok=True)
+        self._init_decode_options(backend, return_bytes, output, cache_decoded, decode_size, prefetch_next)
 
         if download:
             self.download()
@@ -198,19 +771,33 @@ class Caltech256(VisionDataset):
         if not self._check_integrity():
             raise RuntimeError("Dataset not found or corrupted. You can use download=True to download it")
 
-        self.categories = sorted(os.listdir(os.path.join(self.root, "256_ObjectCategories")))
-        self.index: list[int] = []
-        self.y = []
-        for i, c in enumerate(self.categories):
-            n = len(
-                [
-                    item
-                    for item in os.listdir(os.path.join(self.root, "256_ObjectCategories", c))
-                    if item.endswith(".jpg")
-                ]
-            )
-            self.index.extend(range(1, n + 1))
-            self.y.extend(n * [i])
+        cached = _load_index_cache(self.root, "256_ObjectCategories")
+        if cached is not None:
+            self.categories, index, y = cached
+        else:
+            self.categories = sorted(os.listdir(os.path.join(self.root, "256_ObjectCategories")))
+            counts = _count_category_jpgs(os.path.join(self.root, "256_ObjectCategories"), self.categories)
+            index: list[int] = []
+            y: list[int] = []
+            for i, n in enumerate(counts):
+                index.extend(range(1, n + 1))
+                y.extend(n * [i])
+            _save_index_cache(self.root, "256_ObjectCategories", self.categories, index, y)
+
+        # int32 arrays take 4 bytes per sample instead of a boxed Python int each.
+        self.index = np.asarray(index, dtype=np.int32)
+        self.y = np.asarray(y, dtype=np.int32)
+
+        # Resolve every image path once so that __getitem__ does not have to
+        # re-join and re-format path components on each access.
+        self._img_base = os.path.join(self.root, "256_ObjectCategories")
+        self.image_paths = [
+            os.path.join(self._img_base, self.categories[i], f"{i + 1:03d}_{k:04d}.jpg")
+            for i, k in zip(self.y, self.index)
+        ]
+        # The shard is only consulted when explicitly requested, so explicit
+        # decode modes are never overridden by a file someone left in root.
+        self._pixels = self._load_shard_or_raise() if self.output == "shard" else None
 
     def __getitem__(self, index: int) -> tuple[Any, Any]:
         """
@@ -220,23 +807,17 @@ class Caltech256(VisionDataset):
         Returns:
             tuple: (image, target) where target is index of the target class.
         """
-        img = Image.open(
-            os.path.join(
-                self.root,
-                "256_ObjectCategories",
-                self.categories[self.y[index]],
-                f"{self.y[index] + 1:03d}_{self.index[index]:04d}.jpg",
-            )
-        )
-
-        target = self.y[index]
+        img = self._get_image(index)
+        target = int(self.y[index])
 
-        if self.transform is not None:
+        if self.transform is not None and not self.return_bytes:
             img = self.transform(img)
 
         if self.target_transform is not None:
             target = self.target_transform(target)
 
+        self._hint_next(index)
+
         return img, target
 
     def _check_integrity(self) -> bool: